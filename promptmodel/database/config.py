@@ -1,6 +1,16 @@
 from peewee import SqliteDatabase, Model
 
-db = SqliteDatabase("./.promptmodel/promptmodel.db")
+# WAL keeps readers from blocking the writer, and the enlarged page cache
+# lets the per-run prompt lookups hit memory instead of disk. Connections
+# are opened lazily per thread and reused across queries.
+db = SqliteDatabase(
+    "./.promptmodel/promptmodel.db",
+    pragmas={
+        "journal_mode": "wal",
+        "cache_size": -64 * 1000,  # 64MB
+        "synchronous": "normal",
+    },
+)
 
 
 class BaseModel(Model):
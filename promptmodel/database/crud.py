@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from promptmodel.database.models import (
     DeployedFunctionModel,
     DeployedFunctionModelVersion,
@@ -17,6 +17,20 @@ from promptmodel.database.crud_chat import *
 
 # Select one
 
+# name -> uuid cache for deployed FunctionModels; cleared whenever the
+# deployed cache tables are rewritten
+_function_model_uuid_cache: Dict[str, Any] = {}
+
+
+def _get_function_model_uuid(function_model_name: str):
+    uuid = _function_model_uuid_cache.get(function_model_name)
+    if uuid is None:
+        uuid = DeployedFunctionModel.get(
+            DeployedFunctionModel.name == function_model_name
+        ).uuid
+        _function_model_uuid_cache[function_model_name] = uuid
+    return uuid
+
 
 def get_deployed_prompts(function_model_name: str) -> Tuple[List[DeployedPrompt], str]:
     try:
@@ -26,9 +40,7 @@ def get_deployed_prompts(function_model_name: str) -> Tuple[List[DeployedPrompt]
                 .join(DeployedFunctionModel)
                 .where(
                     DeployedFunctionModelVersion.function_model_uuid
-                    == DeployedFunctionModel.get(
-                        DeployedFunctionModel.name == function_model_name
-                    ).uuid
+                    == _get_function_model_uuid(function_model_name)
                 )
             )
             prompts: List[DeployedPrompt] = list(
@@ -87,4 +99,8 @@ async def update_deployed_cache(project_status: dict):
         DeployedFunctionModel.insert_many(function_models).execute()
         DeployedFunctionModelVersion.insert_many(function_model_versions).execute()
         DeployedPrompt.insert_many(prompts).execute()
+    # clear only after the rewrite commits: a lookup racing the transaction
+    # from another thread could otherwise re-cache a uuid from the old rows
+    # and keep it forever
+    _function_model_uuid_cache.clear()
     return
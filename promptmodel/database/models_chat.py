@@ -1,5 +1,6 @@
 import datetime
-import json
+
+import orjson
 
 from uuid import uuid4
 from peewee import (
@@ -18,10 +19,14 @@ from peewee import (
 
 class JSONField(TextField):
     def db_value(self, value):
-        return json.dumps(value)
+        if value is None:
+            return None
+        return orjson.dumps(value).decode()
 
     def python_value(self, value):
-        return json.loads(value)
+        if value is None:
+            return None
+        return orjson.loads(value)
 
 
 # class DeployedChatModel(BaseModel):
@@ -32,4 +32,5 @@ def initialize_db():
                         # ChatLog,
                     ]
                 )
-        db.close()
+        # keep the connection open; later CRUD calls on this thread reuse it
+        # instead of paying a connect/close per query
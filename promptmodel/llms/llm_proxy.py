@@ -1,5 +1,6 @@
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import threading
 from typing import (
     Any,
@@ -41,6 +42,17 @@ from promptmodel.types.response import (
 from promptmodel.types.request import ChatLogRequest
 
 
+@lru_cache(maxsize=256)
+def _escape_prompt_braces(content: str) -> str:
+    """Escape literal braces so str.format only fills {placeholder} slots.
+
+    Prompt templates are stable across runs, so cache the escaped text
+    instead of re-escaping it on every call.
+    """
+    content = content.replace("{", "{{").replace("}", "}}")
+    return content.replace("{{{{", "{").replace("}}}}", "}")
+
+
 class LLMProxy(LLM):
     def __init__(
         self,
@@ -535,13 +547,10 @@ class LLMProxy(LLM):
 
         messages = []
         for prompt in prompts:
-            prompt["content"] = prompt["content"].replace("{", "{{").replace("}", "}}")
-            prompt["content"] = (
-                prompt["content"].replace("{{{{", "{").replace("}}}}", "}")
-            )
+            content = _escape_prompt_braces(prompt["content"])
             messages.append(
                 {
-                    "content": prompt["content"].format(**stringified_inputs),
+                    "content": content.format(**stringified_inputs),
                     "role": prompt["role"],
                 }
             )
@@ -947,8 +956,12 @@ class LLMProxy(LLM):
                 cache_update_thread.daemon = True
                 cache_update_thread.start()
 
-                # get prompt from local DB by ratio
-                prompt_rows, version_detail = get_deployed_prompts(name)
+                # get prompt from local DB by ratio; the SQLite read is
+                # blocking, so run it in the default executor instead of
+                # stalling the event loop
+                prompt_rows, version_detail = await asyncio.get_event_loop().run_in_executor(
+                    None, get_deployed_prompts, name
+                )
                 if prompt_rows is None:
                     return [], {}
 
@@ -6,6 +6,15 @@ def update_dict(
     target: Dict[str, str],
     source: Dict[str, str],
 ):
+    if len(source) == 1:
+        # fast path: streamed chunks almost always carry one active key
+        ((key, value),) = source.items()
+        if value is not None:
+            if key not in target:
+                target[key] = value
+            else:
+                target[key] += value
+        return target
     for key, value in source.items():
         if value is not None:
             if key not in target:
@@ -84,6 +84,9 @@ class CodeReloadHandler(FileSystemEventHandler):
         new_samples = new_devapp_instance.samples
         new_function_schemas = new_devapp_instance._get_function_schema_list()
 
+        # prefer the loop connect_to_gateway is actually running on; the loop
+        # captured at startup may have been replaced by asyncio.run
+        main_loop = self.dev_websocket_client._loop or self.main_loop
         res = run_async_in_sync_threadsafe(
             self.dev_websocket_client.request(
                 ServerTask.SYNC_CODE,
@@ -94,7 +97,7 @@ class CodeReloadHandler(FileSystemEventHandler):
                     "new_schemas": new_function_schemas,
                 },
             ),
-            main_loop=self.main_loop,
+            main_loop=main_loop,
         )
 
         # update_samples(new_devapp_instance.samples)
@@ -1,8 +1,11 @@
 import asyncio
-import json
 import datetime
+import os
+import random
 import re
 
+import orjson
+
 from uuid import UUID, uuid4
 from typing import Dict, Any, Optional, AsyncGenerator, List
 from dotenv import load_dotenv
@@ -11,7 +14,6 @@ from asyncio import Queue
 
 from websockets.client import connect, WebSocketClientProtocol
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
-from readerwriterlock import rwlock
 from playhouse.shortcuts import model_to_dict
 
 import promptmodel.utils.logger as logger
@@ -32,39 +34,177 @@ load_dotenv()
 GATEWAY_URL = f"wss://{ENDPOINT_URL.split('://')[1]}/open_websocket"
 
 
-class CustomJSONEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, UUID):
-            return str(obj)
-        elif isinstance(obj, datetime.datetime):
-            aware_datetime = obj.replace(tzinfo=datetime.timezone.utc)
-            return aware_datetime.isoformat()  # This will include timezone information
-        return super().default(obj)
+def _json_default(obj):
+    if isinstance(obj, UUID):
+        return str(obj)
+    elif isinstance(obj, datetime.datetime):
+        aware_datetime = obj.replace(tzinfo=datetime.timezone.utc)
+        return aware_datetime.isoformat()  # This will include timezone information
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def json_dumps(data: Any) -> bytes:
+    """Serialize with orjson, which is 3-10x faster than stdlib json.
+
+    Returns `bytes` so `ws.send` can frame the payload directly instead of
+    re-encoding a `str` to UTF-8 on every send.
+    """
+    return orjson.dumps(
+        data, default=_json_default, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+    )
+
+
+MERGEABLE_STREAM_KEYS = {"type", "status", "raw_output", "parsed_outputs"}
+
+# bound the stream buffer so a stalled connection applies backpressure to the
+# producing loop instead of buffering a whole run in memory
+STREAM_BUFFER_SIZE = 256
+
+# flush window for batched stream frames; override in milliseconds via
+# PROMPTMODEL_WS_FLUSH_MS to trade latency against frame count
+WS_FLUSH_INTERVAL = float(os.environ.get("PROMPTMODEL_WS_FLUSH_MS", "10")) / 1000
+
+# cap on concurrently running message handlers; excess messages wait on the
+# semaphore instead of spawning unbounded LLM runs
+MAX_CONCURRENT_HANDLERS = 8
+
+# precomputed frame skeletons for the hot streaming loops; copying these is
+# cheaper than rebuilding the dict literals (and enum .value lookups) per token
+RUN_RUNNING_FRAME = {
+    "type": ServerTask.UPDATE_RESULT_RUN.value,
+    "status": "running",
+}
+CHAT_RUNNING_FRAME = {
+    "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
+    "status": "running",
+}
 
 
 class DevWebsocketClient:
     def __init__(self, _devapp: DevApp):
         self._devapp: DevApp = _devapp
-        self.rwlock = rwlock.RWLockFair()
         self.pending_requests: Dict[str, asyncio.Event] = {}
         self.responses: Dict[str, Queue] = defaultdict(Queue)
+        # event loop running connect_to_gateway; other threads must schedule
+        # coroutines on it via asyncio.run_coroutine_threadsafe
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # name -> function_model index, rebuilt whenever the registry list
+        # is swapped (e.g. on code reload)
+        self.__function_model_index: Dict[str, Any] = {}
+        self.__indexed_function_models: Optional[List] = None
+
+    @staticmethod
+    def __merge_stream_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge consecutive token frames into as few frames as possible.
+
+        Only plain streaming frames (raw_output / parsed_outputs) are merged;
+        frames carrying anything else (function_call, api_response, ...) are
+        kept as-is to preserve their position in the stream.
+        """
+        merged: List[Dict[str, Any]] = []
+        for data in batch:
+            if (
+                merged
+                and data.get("status") == "running"
+                and merged[-1].get("status") == "running"
+                and set(data.keys()) <= MERGEABLE_STREAM_KEYS
+                and set(merged[-1].keys()) <= MERGEABLE_STREAM_KEYS
+            ):
+                last = merged[-1]
+                if "raw_output" in data:
+                    last["raw_output"] = (
+                        last.get("raw_output", "") + data["raw_output"]
+                    )
+                if "parsed_outputs" in data:
+                    last["parsed_outputs"] = update_dict(
+                        last.get("parsed_outputs", {}), data["parsed_outputs"]
+                    )
+                if "type" in data and "type" not in last:
+                    last["type"] = data["type"]
+            else:
+                merged.append(data)
+        return merged
+
+    async def __send_stream_buffer(
+        self,
+        ws: WebSocketClientProtocol,
+        stream_buffer: Queue,
+        response: Dict[str, Any],
+        send_failed: asyncio.Event,
+        flush_interval: float = WS_FLUSH_INTERVAL,
+    ):
+        """Drain `stream_buffer` and send the queued frames in batches.
+
+        Coalescing per-token frames into one frame per `flush_interval` window
+        cuts the frame count by one or two orders of magnitude on fast streams
+        and avoids TCP backpressure stalls from many small sends.
+        A `None` in the buffer signals the end of the stream. The first send
+        failure sets `send_failed` so the producing loop can stop generating;
+        the error is re-raised once the stream is fully drained, so the
+        producer can never deadlock on a full buffer either.
+        """
+        error: Optional[Exception] = None
+        closed = False
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+        while not closed:
+            data = await stream_buffer.get()
+            if data is None:
+                break
+            # pace flushes to at most one per flush_interval, giving the
+            # stream the rest of the window to produce more tokens
+            delay = flush_interval - (loop.time() - last_flush)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            batch = [data]
+            while True:
+                try:
+                    data = stream_buffer.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if data is None:
+                    closed = True
+                    break
+                batch.append(data)
+            last_flush = loop.time()
+            if error is not None:
+                continue  # keep draining so the producer never blocks
+            try:
+                for data in self.__merge_stream_batch(batch):
+                    data.update(response)
+                    # logger.debug(f"Sent response: {data}")
+                    await ws.send(json_dumps(data))
+            except Exception as send_error:
+                error = send_error
+                send_failed.set()
+        if error is not None:
+            raise error
 
     async def _get_function_models(self, function_model_name: str):
         """Get function_model from registry"""
-        with self.rwlock.gen_rlock():
-            function_model = next(
-                (
-                    function_model
-                    for function_model in self._devapp.function_models
-                    if function_model.name == function_model_name
-                ),
-                None,
-            )
-        return function_model
+        function_models = self._devapp.function_models
+        if function_models is not self.__indexed_function_models:
+            self.__function_model_index = {
+                function_model.name: function_model
+                for function_model in function_models
+            }
+            self.__indexed_function_models = function_models
+        return self.__function_model_index.get(function_model_name)
 
     def update_devapp_instance(self, new_devapp):
-        with self.rwlock.gen_wlock():
-            self._devapp = new_devapp
+        # attribute assignment is atomic under the GIL, so the reload thread
+        # can swap in the new instance without locking out the event loop
+        self._devapp = new_devapp
+
+    async def __handle_message_bounded(
+        self,
+        message: Dict[str, Any],
+        ws: WebSocketClientProtocol,
+        semaphore: asyncio.Semaphore,
+    ):
+        """Run __handle_message once the concurrency semaphore admits it."""
+        async with semaphore:
+            await self.__handle_message(message, ws)
 
     async def __handle_message(
         self, message: Dict[str, Any], ws: WebSocketClientProtocol
@@ -82,8 +222,12 @@ class DevWebsocketClient:
 
         data = None
         try:
-            if message["type"] == LocalTask.RUN_PROMPT_MODEL:
-                messages: List[Dict] = message["messages_for_run"]
+            # keep the lookup inside the try so a message without "type" is
+            # reported through the error path below
+            message_type = message["type"]
+            if message_type == LocalTask.RUN_PROMPT_MODEL:
+                # share the incoming list; nothing below copies it per token
+                messages_for_run: List[Dict] = message["messages_for_run"]
 
                 # # Check function_model in Local Usage
                 # function_model_names = self._devapp._get_function_model_name_list()
@@ -105,21 +249,17 @@ class DevWebsocketClient:
                     }
                     data.update(response)
                     # logger.debug(f"Sent response: {data}")
-                    await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                    await ws.send(json_dumps(data))
 
                     model = message["model"]
                     parsing_type = message["parsing_type"]
 
-                    messages_for_run = messages
-
                     parsing_success = True
                     error_log = None
                     function_call = None
-                    function_schemas: Optional[List[Dict]] = (
-                        message["function_schemas"]
-                        if "function_schemas" in message
-                        else None
-                    )  # ehese schemata have mock_response which should not be sent to LLM
+                    function_schemas: Optional[List[Dict]] = message.get(
+                        "function_schemas"
+                    )  # these schemata have mock_response which should not be sent to LLM
                     function_mock_responses = {}
 
                     if function_schemas:
@@ -140,51 +280,60 @@ class DevWebsocketClient:
                         model=model,
                     )
 
-                    async for item in res:
-                        # send item to backend
-                        # save item & parse
-                        # if type(item) == str: raw output, if type(item) == dict: parsed output
-                        data = {"status": "running"}
-                        
-                        if item.raw_output is not None:
-                            output["raw_output"] += item.raw_output
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_RUN.value,
-                                "status": "running",
-                                "raw_output": item.raw_output,
-                            }
-                        if item.parsed_outputs:
-                            output["parsed_outputs"] = update_dict(
-                                output["parsed_outputs"], item.parsed_outputs
-                            )
+                    stream_buffer: Queue = Queue(maxsize=STREAM_BUFFER_SIZE)
+                    send_failed = asyncio.Event()
+                    sender_task = asyncio.create_task(
+                        self.__send_stream_buffer(
+                            ws, stream_buffer, response, send_failed
+                        )
+                    )
+                    try:
+                        async for item in res:
+                            if send_failed.is_set():
+                                # stop generating; awaiting the sender below
+                                # re-raises the send error
+                                break
+                            # send item to backend
+                            # save item & parse
+                            # if type(item) == str: raw output, if type(item) == dict: parsed output
+                            data = {"status": "running"}
 
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_RUN.value,
-                                "status": "running",
-                                "parsed_outputs": item.parsed_outputs,
-                            }
-                        if item.function_call is not None:
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_RUN.value,
-                                "status": "running",
-                                "function_call": item.function_call.model_dump(),
-                            }
-                            function_call = item.function_call.model_dump()
+                            if item.raw_output is not None:
+                                output["raw_output"] += item.raw_output
+                                data = {
+                                    **RUN_RUNNING_FRAME,
+                                    "raw_output": item.raw_output,
+                                }
+                            if item.parsed_outputs:
+                                output["parsed_outputs"] = update_dict(
+                                    output["parsed_outputs"], item.parsed_outputs
+                                )
 
-                        if item.error and parsing_success is True:
-                            parsing_success = not item.error
-                            error_log = item.error_log
-                            
-                        if item.api_response and "message" in item.api_response.choices[0]:
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_RUN.value,
-                                "status": "running",
-                                "api_response": item.api_response.model_dump(),
-                            }
-                            
-                        data.update(response)
-                        # logger.debug(f"Sent response: {data}")
-                        await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                                data = {
+                                    **RUN_RUNNING_FRAME,
+                                    "parsed_outputs": item.parsed_outputs,
+                                }
+                            if item.function_call is not None:
+                                data = {
+                                    **RUN_RUNNING_FRAME,
+                                    "function_call": item.function_call.model_dump(),
+                                }
+                                function_call = item.function_call.model_dump()
+
+                            if item.error and parsing_success is True:
+                                parsing_success = not item.error
+                                error_log = item.error_log
+
+                            if item.api_response and "message" in item.api_response.choices[0]:
+                                data = {
+                                    **RUN_RUNNING_FRAME,
+                                    "api_response": item.api_response.model_dump(),
+                                }
+
+                            await stream_buffer.put(data)
+                    finally:
+                        await stream_buffer.put(None)
+                        await sender_task
 
                     # IF function_call in response -> call function
                     if function_call:
@@ -194,7 +343,7 @@ class DevWebsocketClient:
                         ):
                             # call function
                             try:
-                                function_call_args: Dict[str, Any] = json.loads(
+                                function_call_args: Dict[str, Any] = orjson.loads(
                                     function_call["arguments"]
                                 )
                                 function_response = (
@@ -214,7 +363,7 @@ class DevWebsocketClient:
                                 }
                                 data.update(response)
                                 # logger.debug(f"Sent response: {data}")
-                                await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                                await ws.send(json_dumps(data))
                             except Exception as error:
                                 logger.error(f"{error}")
 
@@ -225,10 +374,8 @@ class DevWebsocketClient:
                                     "log": f"Function call Failed, {error}",
                                 }
 
-                                response.update(data)
-                                await ws.send(
-                                    json.dumps(response, cls=CustomJSONEncoder)
-                                )
+                                data.update(response)
+                                await ws.send(json_dumps(data))
                                 return
 
                         else:
@@ -246,7 +393,7 @@ class DevWebsocketClient:
                             }
                             data.update(response)
                             # logger.debug(f"Sent response: {data}")
-                            await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                            await ws.send(json_dumps(data))
 
                     if (
                         message["output_keys"] is not None
@@ -265,8 +412,8 @@ class DevWebsocketClient:
                             "error_type": LocalTaskErrorType.PARSING_FAILED_ERROR.value,
                             "log": f"parsing failed, {error_log}",
                         }
-                        response.update(data)
-                        await ws.send(json.dumps(response, cls=CustomJSONEncoder))
+                        data.update(response)
+                        await ws.send(json_dumps(data))
                         return
 
                     data = {
@@ -282,11 +429,11 @@ class DevWebsocketClient:
                         "error_type": LocalTaskErrorType.SERVICE_ERROR.value,
                         "log": str(error),
                     }
-                    response.update(data)
-                    await ws.send(json.dumps(response, cls=CustomJSONEncoder))
+                    data.update(response)
+                    await ws.send(json_dumps(data))
                     return
 
-            elif message["type"] == LocalTask.RUN_CHAT_MODEL:
+            elif message_type == LocalTask.RUN_CHAT_MODEL:
                 old_messages = message["old_messages"]
                 new_messages = message["new_messages"]
                 # move tool_calls in old_messages into new_messages
@@ -308,10 +455,8 @@ class DevWebsocketClient:
                     error_log = None
                     function_call = None
 
-                    function_schemas: Optional[List[Dict]] = (
-                        message["function_schemas"]
-                        if "function_schemas" in message
-                        else None
+                    function_schemas: Optional[List[Dict]] = message.get(
+                        "function_schemas"
                     )  # this has a mock_response which should not be sent to LLM
                     function_mock_responses = {}
 
@@ -333,41 +478,51 @@ class DevWebsocketClient:
                     )
 
                     raw_output = ""
-                    async for chunk in res:
-                        data = {"status": "running"}
-                        logger.debug(f"Chunk: {chunk}")
-                        if chunk.raw_output is not None:
-                            raw_output += chunk.raw_output
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
-                                "status": "running",
-                                "raw_output": chunk.raw_output,
-                            }
-                        if chunk.function_call is not None:
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
-                                "status": "running",
-                                "function_call": chunk.function_call.model_dump(),
-                            }
-                            if function_call is None:
-                                function_call = {}
-                            function_call = update_dict(
-                                function_call, chunk.function_call.model_dump()
-                            )
+                    stream_buffer: Queue = Queue(maxsize=STREAM_BUFFER_SIZE)
+                    send_failed = asyncio.Event()
+                    sender_task = asyncio.create_task(
+                        self.__send_stream_buffer(
+                            ws, stream_buffer, response, send_failed
+                        )
+                    )
+                    try:
+                        async for chunk in res:
+                            if send_failed.is_set():
+                                # stop generating; awaiting the sender below
+                                # re-raises the send error
+                                break
+                            data = {"status": "running"}
+                            logger.debug(f"Chunk: {chunk}")
+                            if chunk.raw_output is not None:
+                                raw_output += chunk.raw_output
+                                data = {
+                                    **CHAT_RUNNING_FRAME,
+                                    "raw_output": chunk.raw_output,
+                                }
+                            if chunk.function_call is not None:
+                                data = {
+                                    **CHAT_RUNNING_FRAME,
+                                    "function_call": chunk.function_call.model_dump(),
+                                }
+                                if function_call is None:
+                                    function_call = {}
+                                function_call = update_dict(
+                                    function_call, chunk.function_call.model_dump()
+                                )
 
-                        if chunk.error:
-                            error_log = chunk.error_log
-                            
-                        if chunk.api_response and "message" in chunk.api_response.choices[0]:
-                            data = {
-                                "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
-                                "status": "running",
-                                "api_response": chunk.api_response.model_dump(),
-                            }
+                            if chunk.error:
+                                error_log = chunk.error_log
 
-                        data.update(response)
-                        # logger.debug(f"Sent response: {data}")
-                        await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                            if chunk.api_response and "message" in chunk.api_response.choices[0]:
+                                data = {
+                                    **CHAT_RUNNING_FRAME,
+                                    "api_response": chunk.api_response.model_dump(),
+                                }
+
+                            await stream_buffer.put(data)
+                    finally:
+                        await stream_buffer.put(None)
+                        await sender_task
                     # IF function_call in response -> call function -> call LLM once more
                     logger.debug(f"Function call: {function_call}")
 
@@ -378,7 +533,7 @@ class DevWebsocketClient:
                         ):
                             # call function
                             try:
-                                function_call_args: Dict[str, Any] = json.loads(
+                                function_call_args: Dict[str, Any] = orjson.loads(
                                     function_call["arguments"]
                                 )
                                 function_response = (
@@ -397,7 +552,7 @@ class DevWebsocketClient:
                                     },
                                 }
                                 data.update(response)
-                                await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                                await ws.send(json_dumps(data))
                                 logger.debug(f"Sent response: {data}")
                             except Exception as error:
                                 logger.error(f"{error}")
@@ -409,10 +564,8 @@ class DevWebsocketClient:
                                     "log": f"Function call Failed, {error}",
                                 }
 
-                                response.update(data)
-                                await ws.send(
-                                    json.dumps(response, cls=CustomJSONEncoder)
-                                )
+                                data.update(response)
+                                await ws.send(json_dumps(data))
                                 return
                         else:
                             # return mock response
@@ -427,7 +580,7 @@ class DevWebsocketClient:
                             }
                             data.update(response)
                             # logger.debug(f"Sent response: {data}")
-                            await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                            await ws.send(json_dumps(data))
                             function_response = function_mock_responses[
                                 function_call["name"]
                             ]
@@ -454,29 +607,40 @@ class DevWebsocketClient:
                         )
 
                         raw_output = ""
-                        async for item in res_after_function_call:
-                            data = {"status": "running"}
-                            if item.raw_output is not None:
-                                raw_output += item.raw_output
-                                data = {
-                                    "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
-                                    "status": "running",
-                                    "raw_output": item.raw_output,
-                                }
-
-                            if item.error:
-                                error_log = item.error_log
-                                
-                            if chunk.api_response and "message" in chunk.api_response.choices[0]:
-                                data = {
-                                    "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
-                                    "status": "running",
-                                    "api_response": chunk.api_response.model_dump(),
-                                }
-
-                            data.update(response)
-                            # logger.debug(f"Sent response: {data}")
-                            await ws.send(json.dumps(data, cls=CustomJSONEncoder))
+                        stream_buffer: Queue = Queue(maxsize=STREAM_BUFFER_SIZE)
+                        send_failed = asyncio.Event()
+                        sender_task = asyncio.create_task(
+                            self.__send_stream_buffer(
+                                ws, stream_buffer, response, send_failed
+                            )
+                        )
+                        try:
+                            async for item in res_after_function_call:
+                                if send_failed.is_set():
+                                    # stop generating; awaiting the sender
+                                    # below re-raises the send error
+                                    break
+                                data = {"status": "running"}
+                                if item.raw_output is not None:
+                                    raw_output += item.raw_output
+                                    data = {
+                                        **CHAT_RUNNING_FRAME,
+                                        "raw_output": item.raw_output,
+                                    }
+
+                                if item.error:
+                                    error_log = item.error_log
+
+                                if chunk.api_response and "message" in chunk.api_response.choices[0]:
+                                    data = {
+                                        **CHAT_RUNNING_FRAME,
+                                        "api_response": chunk.api_response.model_dump(),
+                                    }
+
+                                await stream_buffer.put(data)
+                        finally:
+                            await stream_buffer.put(None)
+                            await sender_task
 
                     data = {
                         "type": ServerTask.UPDATE_RESULT_CHAT_RUN.value,
@@ -491,14 +655,14 @@ class DevWebsocketClient:
                         "error_type": LocalTaskErrorType.SERVICE_ERROR.value,
                         "log": str(error),
                     }
-                    response.update(data)
-                    await ws.send(json.dumps(response, cls=CustomJSONEncoder))
+                    data.update(response)
+                    await ws.send(json_dumps(data))
                     return
 
             if data:
-                response.update(data)
-                await ws.send(json.dumps(response, cls=CustomJSONEncoder))
-            logger.info(f"Sent response: {response}")
+                data.update(response)
+                await ws.send(json_dumps(data))
+                logger.info(f"Sent response: {data}")
         except Exception as error:
             logger.error(f"Error handling message: {error}")
             await ws.send(str(error))
@@ -512,15 +676,31 @@ class DevWebsocketClient:
         retry_delay=5 * 60,
     ):
         """Open Websocket to Backend with project_uuid, connection_name, cli_access_token"""
-        headers = cli_access_header
-        headers.update(
-            {"project_uuid": project_uuid, "connection_name": connection_name}
-        )
-        for _ in range(retries):
+        self._loop = asyncio.get_running_loop()
+        # build the handshake headers once and reuse the same dict for every
+        # reconnect attempt, without mutating the caller's header dict
+        headers = {
+            **cli_access_header,
+            "project_uuid": project_uuid,
+            "connection_name": connection_name,
+        }
+        handler_tasks: set = set()
+        handler_semaphore = asyncio.Semaphore(MAX_CONCURRENT_HANDLERS)
+
+        def on_handler_done(task: asyncio.Task):
+            handler_tasks.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Error handling message: {task.exception()}")
+
+        backoff = 5
+        for attempt in range(retries):
             try:
                 async with connect(
                     GATEWAY_URL,
                     extra_headers=headers,
+                    # frames are small streamed JSON chunks; permessage-deflate
+                    # costs more CPU per frame than the bytes it saves
+                    compression=None,
                     # ping_interval=10,
                     # ping_timeout=1,
                     # timeout=3600 * 24,  # Timeout is set to 24 hours
@@ -529,7 +709,11 @@ class DevWebsocketClient:
                     self.ws = ws
                     while True:
                         message = await ws.recv()
-                        data = json.loads(message)
+                        # reset backoff only once the gateway actually delivers
+                        # a message; a backend that accepts the handshake and
+                        # immediately drops should keep backing off
+                        backoff = 5
+                        data = orjson.loads(message)
                         correlation_id = data.get("correlation_id")
 
                         if correlation_id and correlation_id in self.pending_requests:
@@ -539,17 +723,35 @@ class DevWebsocketClient:
                                     correlation_id
                                 ].set()  # Signal the event that the response has arrived
                         else:
-                            await self.__handle_message(data, ws)
+                            # handle each message in its own task so a long
+                            # run does not block the receive loop; the
+                            # semaphore bounds how many run at once
+                            task = asyncio.create_task(
+                                self.__handle_message_bounded(
+                                    data, ws, handler_semaphore
+                                )
+                            )
+                            handler_tasks.add(task)
+                            task.add_done_callback(on_handler_done)
             except (ConnectionClosedError, ConnectionClosedOK):
                 # If the connection was closed gracefully, handle it accordingly
                 logger.warning("Connection to the gateway was closed.")
             except TimeoutError:
-                logger.error(
-                    f"Timeout error while connecting to the gateway. Retrying in {retry_delay} seconds..."
-                )
-                await asyncio.sleep(retry_delay)
+                logger.error("Timeout error while connecting to the gateway.")
             except Exception as error:
                 logger.error(f"Error receiving message: {error}")
+            finally:
+                # let in-flight handlers finish before reconnecting
+                if handler_tasks:
+                    await asyncio.gather(*handler_tasks, return_exceptions=True)
+                    handler_tasks.clear()
+            if attempt + 1 < retries:
+                # exponential backoff with jitter so reconnecting clients
+                # don't hammer the gateway in lockstep
+                delay = backoff + random.uniform(0, backoff / 2)
+                logger.warning(f"Retrying in {delay:.0f} seconds...")
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, retry_delay)
 
     async def request(self, type: ServerTask, message: Dict = {}):
         """
@@ -564,7 +766,7 @@ class DevWebsocketClient:
 
             try:
                 message["type"] = type.value
-                await ws.send(json.dumps(message))
+                await ws.send(json_dumps(message))
                 logger.success(
                     f"""Sent request to local.
     - Message: {message}"""
@@ -33,10 +33,10 @@ setup(
         "litellm>=1.7.1",
         # "litellm@git+https://github.com/weavel-ai/litellm.git@llms_add_clova_support",
         "python-dotenv",
+        "orjson",
         "websockets",
         "termcolor",
         "watchdog",
-        "readerwriterlock",
         "nest-asyncio",
     ],
     python_requires=">=3.8.10",
@@ -15,10 +15,15 @@ async def test_connect_to_gateway(
     connection_name = "test_project"
     cli_access_header = {"Authorization": "Bearer testtoken"}
 
+    # messages are dispatched as tasks, so the receive loop ends when recv
+    # raises after the first message
+    mock_websocket.recv = AsyncMock(
+        side_effect=['{"key" : "value"}', ConnectionClosedOK(None, None)]
+    )
+
     with patch.object(
         websocket_client, "_DevWebsocketClient__handle_message", new_callable=AsyncMock
     ) as mock_function:
-        mock_function.side_effect = ConnectionClosedOK(None, None)
         with patch(
             "promptmodel.websocket.websocket_client.connect",
             new_callable=MagicMock,
@@ -29,7 +34,7 @@ async def test_connect_to_gateway(
                 project_uuid, connection_name, cli_access_header, retries=1
             ),
             mock_connect.assert_called_once()
-            mock_websocket.recv.assert_called_once()
+            assert mock_websocket.recv.call_count == 2
             websocket_client._DevWebsocketClient__handle_message.assert_called_once()
 
 
@@ -58,7 +58,7 @@ async def test_run_model_function_call(
 
     function_schemas_in_db[0]["mock_response"] = "13"
 
-    mocker.patch("promptmodel.websocket.websocket_client.json.dumps", mock_json_dumps)
+    mocker.patch("promptmodel.websocket.websocket_client.json_dumps", mock_json_dumps)
 
     # success case
     await websocket_client._DevWebsocketClient__handle_message(
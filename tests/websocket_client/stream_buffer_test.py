@@ -0,0 +1,152 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncio
+
+from promptmodel.websocket.websocket_client import DevWebsocketClient
+from promptmodel.types.enums import ServerTask
+
+
+def test_merge_stream_batch(websocket_client: DevWebsocketClient):
+    merge = websocket_client._DevWebsocketClient__merge_stream_batch
+
+    # consecutive raw_output frames are concatenated into one frame
+    merged = merge(
+        [
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "raw_output": "Hello ",
+            },
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "raw_output": "world",
+            },
+        ]
+    )
+    assert len(merged) == 1
+    assert merged[0]["raw_output"] == "Hello world"
+
+    # parsed_outputs are concatenated per key
+    merged = merge(
+        [
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "parsed_outputs": {"response": "foo"},
+            },
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "parsed_outputs": {"response": "bar"},
+            },
+        ]
+    )
+    assert len(merged) == 1
+    assert merged[0]["parsed_outputs"] == {"response": "foobar"}
+
+    # non-mergeable frames keep their position and break merging
+    merged = merge(
+        [
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "raw_output": "a",
+            },
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "function_call": {"name": "get_current_weather"},
+            },
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "raw_output": "b",
+            },
+        ]
+    )
+    assert len(merged) == 3
+    assert merged[0]["raw_output"] == "a"
+    assert "function_call" in merged[1]
+    assert merged[2]["raw_output"] == "b"
+
+
+@pytest.mark.asyncio
+async def test_send_stream_buffer_batches(
+    mocker,
+    websocket_client: DevWebsocketClient,
+    mock_websocket: AsyncMock,
+    mock_json_dumps: MagicMock,
+):
+    mocker.patch("promptmodel.websocket.websocket_client.json_dumps", mock_json_dumps)
+
+    stream_buffer = asyncio.Queue()
+    for token in ["foo ", "bar ", "baz"]:
+        await stream_buffer.put(
+            {
+                "type": ServerTask.UPDATE_RESULT_RUN.value,
+                "status": "running",
+                "raw_output": token,
+            }
+        )
+    await stream_buffer.put(None)
+
+    send_failed = asyncio.Event()
+    await websocket_client._DevWebsocketClient__send_stream_buffer(
+        mock_websocket,
+        stream_buffer,
+        {"correlation_id": "test_id"},
+        send_failed,
+        flush_interval=0,
+    )
+
+    # queued frames are coalesced into one frame with the envelope merged in
+    data = [arg.args[0] for arg in mock_websocket.send.call_args_list]
+    assert len(data) == 1
+    assert data[0]["raw_output"] == "foo bar baz"
+    assert data[0]["correlation_id"] == "test_id"
+    assert not send_failed.is_set()
+
+
+@pytest.mark.asyncio
+async def test_send_stream_buffer_send_failure(
+    mocker,
+    websocket_client: DevWebsocketClient,
+    mock_websocket: AsyncMock,
+    mock_json_dumps: MagicMock,
+):
+    mocker.patch("promptmodel.websocket.websocket_client.json_dumps", mock_json_dumps)
+    mock_websocket.send = AsyncMock(side_effect=RuntimeError("socket died"))
+
+    stream_buffer = asyncio.Queue(maxsize=2)
+    send_failed = asyncio.Event()
+    sender_task = asyncio.create_task(
+        websocket_client._DevWebsocketClient__send_stream_buffer(
+            mock_websocket,
+            stream_buffer,
+            {},
+            send_failed,
+            flush_interval=0,
+        )
+    )
+
+    # the producer keeps queueing past the buffer size after the send fails;
+    # the sender must drain instead of deadlocking on the full queue
+    for i in range(10):
+        await asyncio.wait_for(
+            stream_buffer.put(
+                {
+                    "type": ServerTask.UPDATE_RESULT_RUN.value,
+                    "status": "running",
+                    "raw_output": f"tok{i}",
+                }
+            ),
+            timeout=1,
+        )
+    await stream_buffer.put(None)
+
+    # the first failed send flags the producer and re-raises once drained
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(sender_task, timeout=1)
+    assert send_failed.is_set()